@@ -17,19 +17,26 @@
 """Kubernetes executor plugin for the Covalent dispatcher."""
 
 import base64
+import fcntl
+import functools
+import hashlib
+import json
 import os
 import shutil
 import subprocess
+import sys
 import tempfile
 import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import cloudpickle as pickle
 import docker
 import toml
 from covalent._shared_files.config import get_config
 from covalent._shared_files.logger import app_log
+from covalent._workflow.transport import TransportableObject
 from covalent.executor import BaseExecutor
 from kubernetes import client, config
 from kubernetes.client.rest import ApiException
@@ -47,10 +54,15 @@ _EXECUTOR_PLUGIN_DEFAULTS = {
     "memory": "1G",
     "cache_dir": os.path.join(os.environ["HOME"], ".cache/covalent"),
     "poll_freq": 10,
+    "memoize": False,
+    "memoize_ttl": 0,
+    "memoize_max_entries": 0,
 }
 
 EXECUTOR_PLUGIN_NAME = "KubernetesExecutor"
 
+_MEMO_INDEX_FILENAME = "memo-index.json"
+
 
 class KubernetesExecutor(BaseExecutor):
     """Kubernetes executor plugin class."""
@@ -68,6 +80,9 @@ class KubernetesExecutor(BaseExecutor):
         poll_freq: int = 0,
         vcpu: str = "",
         memory: str = "",
+        memoize: Optional[bool] = None,
+        memoize_ttl: Optional[int] = None,
+        memoize_max_entries: Optional[int] = None,
         **kwargs,
     ):
         self.base_image = base_image or get_config("executors.k8s.base_image")
@@ -83,6 +98,15 @@ class KubernetesExecutor(BaseExecutor):
         self.poll_freq = poll_freq or get_config("executors.k8s.poll_freq")
         self.vcpu = vcpu or get_config("executors.k8s.vcpu")
         self.memory = memory or get_config("executors.k8s.memory")
+        self.memoize = get_config("executors.k8s.memoize") if memoize is None else memoize
+        self.memoize_ttl = (
+            get_config("executors.k8s.memoize_ttl") if memoize_ttl is None else memoize_ttl
+        )
+        self.memoize_max_entries = (
+            get_config("executors.k8s.memoize_max_entries")
+            if memoize_max_entries is None
+            else memoize_max_entries
+        )
 
         if "cache_dir" not in kwargs:
             kwargs["cache_dir"] = get_config("executors.k8s.cache_dir")
@@ -111,6 +135,16 @@ class KubernetesExecutor(BaseExecutor):
         job_name = f"job-{run_id}"
         docker_working_dir = "/data"
 
+        # Create the cache directory used for storing pickles and metadata
+        Path(self.cache_dir).mkdir(parents=True, exist_ok=True)
+
+        # Return a previously computed result for identical inputs
+        memo_key = self._memo_key(function, args, kwargs) if self.memoize else None
+        if memo_key:
+            found, result = self._memo_lookup(memo_key)
+            if found:
+                return result
+
         # Load Kubernetes config file
         app_log.debug("Loading the Kubernetes configuration")
         config.load_kube_config(config_file=self.k8s_config_file, context=self.k8s_context)
@@ -128,9 +162,6 @@ class KubernetesExecutor(BaseExecutor):
         # Create the client
         api_client = config.new_client_from_config(context=self.k8s_context)
 
-        # Create the cache directory used for storing pickles and metadata
-        Path(self.cache_dir).mkdir(parents=True, exist_ok=True)
-
         # Containerize the task and perform any necessary transfers
         image_uri = self._package_and_upload(
             function,
@@ -199,6 +230,9 @@ class KubernetesExecutor(BaseExecutor):
         app_log.debug("Querying job result.")
         result = self._query_result(result_filename, image_tag)
 
+        if memo_key:
+            self._memo_store(memo_key, result)
+
         return result
 
     def _format_exec_script(
@@ -507,3 +541,348 @@ s3.upload_file(local_result_filename, "{self.data_store[5:].split("/")[0]}", "{r
         os.remove(os.path.join(self.cache_dir, result_filename))
 
         return result
+
+    def _memo_canonicalize(self, obj: Any) -> Any:
+        """Replace the parts of a task which vary between processes with stable equivalents.
+
+        Covalent wraps the electron and its arguments in ``TransportableObject`` instances,
+        whose string representation may contain memory addresses. Only their serialized
+        payload is kept.
+
+        Args:
+            obj: A task component, possibly nested in partials, sequences and dictionaries.
+
+        Returns:
+            canonical: An equivalent object suitable for hashing.
+        """
+
+        if isinstance(obj, TransportableObject):
+            return ("TransportableObject", obj.get_serialized())
+        if isinstance(obj, functools.partial):
+            return (
+                "partial",
+                self._memo_canonicalize(obj.func),
+                self._memo_canonicalize(obj.args),
+                self._memo_canonicalize(obj.keywords),
+            )
+        if isinstance(obj, (list, tuple)):
+            return (type(obj).__name__, tuple(self._memo_canonicalize(item) for item in obj))
+        if isinstance(obj, dict):
+            return (
+                "dict",
+                tuple((key, self._memo_canonicalize(value)) for key, value in obj.items()),
+            )
+        return obj
+
+    def _memo_key(self, function: callable, args: List, kwargs: Dict) -> str:
+        """Compute the memoization key of a task.
+
+        The key covers the serialized task as well as the base image and the Python and
+        cloudpickle versions used to serialize it, so that a change of environment does
+        not return stale results.
+
+        Args:
+            function: A callable Python function.
+            args: Positional arguments consumed by the task.
+            kwargs: Keyword arguments consumed by the task.
+
+        Returns:
+            key: SHA-256 hex digest of the serialized task and its environment.
+        """
+
+        environment = f"{self.base_image}|{sys.version_info[:2]}|{pickle.__version__}"
+
+        key = hashlib.sha256(environment.encode("utf-8"))
+        key.update(pickle.dumps(self._memo_canonicalize((function, args, kwargs))))
+
+        return key.hexdigest()
+
+    @contextmanager
+    def _memo_lock(self):
+        """Serialize updates of the memoization index between tasks on this host."""
+
+        with open(os.path.join(self.cache_dir, f"{_MEMO_INDEX_FILENAME}.lock"), "w") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _memo_fetch(self, filename: str) -> Optional[str]:
+        """Fetch a memoization file from the data store.
+
+        Files kept in S3 are downloaded to a unique temporary file in the cache directory,
+        which must be removed with ``_memo_release`` once read.
+
+        Args:
+            filename: Name of the file in the data store.
+
+        Returns:
+            local_filename: Path to the local copy, or None if the file does not exist.
+        """
+
+        if self.data_store.startswith("s3://"):
+            import boto3
+            from botocore.exceptions import ClientError
+
+            fd, local_filename = tempfile.mkstemp(dir=self.cache_dir)
+            os.close(fd)
+
+            s3 = boto3.client("s3")
+            try:
+                s3.download_file(self.data_store[5:].split("/")[0], filename, local_filename)
+            except ClientError:
+                os.remove(local_filename)
+                return None
+
+            return local_filename
+
+        local_filename = os.path.join(self.cache_dir, filename)
+        return local_filename if os.path.exists(local_filename) else None
+
+    def _memo_release(self, local_filename: str) -> None:
+        """Remove a local copy returned by ``_memo_fetch`` if it was downloaded from S3.
+
+        Args:
+            local_filename: Path returned by ``_memo_fetch``.
+
+        Returns:
+            None
+        """
+
+        if self.data_store.startswith("s3://") and os.path.exists(local_filename):
+            os.remove(local_filename)
+
+    def _memo_push(self, local_filename: str, filename: str) -> None:
+        """Move a local file into the data store.
+
+        Args:
+            local_filename: Path of the file to move, which is consumed.
+            filename: Name of the file in the data store.
+
+        Returns:
+            None
+        """
+
+        if self.data_store.startswith("s3://"):
+            import boto3
+
+            s3 = boto3.client("s3")
+            try:
+                s3.upload_file(local_filename, self.data_store[5:].split("/")[0], filename)
+            finally:
+                os.remove(local_filename)
+        else:
+            os.replace(local_filename, os.path.join(self.cache_dir, filename))
+
+    def _memo_delete(self, filename: str) -> None:
+        """Delete a memoization file from the data store.
+
+        Args:
+            filename: Name of the file to delete.
+
+        Returns:
+            None
+        """
+
+        if self.data_store.startswith("s3://"):
+            import boto3
+
+            s3 = boto3.client("s3")
+            s3.delete_object(Bucket=self.data_store[5:].split("/")[0], Key=filename)
+            return
+
+        local_filename = os.path.join(self.cache_dir, filename)
+        if os.path.exists(local_filename):
+            os.remove(local_filename)
+
+    def _memo_load_index(self) -> Dict:
+        """Load the memoization index from the data store.
+
+        A missing or unreadable index is treated as empty.
+
+        Returns:
+            index: Dictionary holding the cumulative ``hits`` and ``misses`` counters and the
+                ``entries`` mapping task keys to their metadata.
+        """
+
+        index = {}
+
+        index_filename = self._memo_fetch(_MEMO_INDEX_FILENAME)
+        if index_filename:
+            try:
+                with open(index_filename, "r") as f:
+                    index = json.load(f)
+            except ValueError as e:
+                app_log.warning(f"Discarding unreadable memoization index: {e}")
+            finally:
+                self._memo_release(index_filename)
+
+        index.setdefault("hits", 0)
+        index.setdefault("misses", 0)
+        index.setdefault("entries", {})
+
+        return index
+
+    def _memo_evict(self, index: Dict) -> List[str]:
+        """Remove stale entries from the memoization index.
+
+        Entries older than ``memoize_ttl`` seconds are dropped, after which the least
+        recently used entries are dropped until at most ``memoize_max_entries`` remain.
+        A limit of 0 disables it.
+
+        Args:
+            index: The memoization index, modified in place.
+
+        Returns:
+            filenames: Names of the result files belonging to the evicted entries.
+        """
+
+        entries = index["entries"]
+
+        now = time.time()
+        expired = [
+            key
+            for key, entry in entries.items()
+            if self.memoize_ttl and now - entry["created"] > self.memoize_ttl
+        ]
+
+        lru = sorted(
+            (key for key in entries if key not in expired),
+            key=lambda key: entries[key]["last_access"],
+        )
+        if self.memoize_max_entries:
+            expired += lru[: max(len(lru) - self.memoize_max_entries, 0)]
+
+        return [entries.pop(key)["result_filename"] for key in expired]
+
+    def _memo_update_index(self, update: Callable[[Dict], None]) -> Dict:
+        """Apply an update to the memoization index and write it back to the data store.
+
+        The index is re-read immediately before the update so that entries written by
+        other tasks are merged rather than overwritten. Tasks on the same host are
+        serialized with a file lock; writers on different hosts sharing an S3 data
+        store are not, and the last one to write wins.
+
+        Args:
+            update: Callable modifying the index in place, run while holding the lock.
+
+        Returns:
+            index: The updated index.
+        """
+
+        with self._memo_lock():
+            index = self._memo_load_index()
+            update(index)
+            evicted = self._memo_evict(index)
+
+            # Write atomically so that concurrent readers never see a partial index
+            with tempfile.NamedTemporaryFile(
+                dir=self.cache_dir, mode="w", delete=False
+            ) as index_file:
+                json.dump(index, index_file)
+            self._memo_push(index_file.name, _MEMO_INDEX_FILENAME)
+
+            live = {entry["result_filename"] for entry in index["entries"].values()}
+            for filename in set(evicted) - live:
+                app_log.debug(f"Evicting memoized result {filename}.")
+                try:
+                    self._memo_delete(filename)
+                except Exception as e:
+                    app_log.warning(f"Failed to delete memoized result {filename}: {e}")
+
+        return index
+
+    def _memo_lookup(self, key: str) -> Tuple[bool, Any]:
+        """Look up a memoized result and record the hit or miss.
+
+        Failures are logged and reported as a miss so that the task is executed.
+
+        Args:
+            key: Memoization key of the task.
+
+        Returns:
+            found: Whether a valid memoized result exists.
+            result: The memoized result, or None on a miss.
+        """
+
+        found, result = False, None
+
+        try:
+            entry = self._memo_load_index()["entries"].get(key)
+
+            if entry and self.memoize_ttl and time.time() - entry["created"] > self.memoize_ttl:
+                entry = None
+
+            result_filename = self._memo_fetch(entry["result_filename"]) if entry else None
+
+            if result_filename:
+                try:
+                    with open(result_filename, "rb") as f:
+                        result = pickle.load(f)
+                    found = True
+                finally:
+                    self._memo_release(result_filename)
+
+        except Exception as e:
+            app_log.warning(f"Memoization lookup for {key} failed: {e}")
+
+        def _record_lookup(index: Dict) -> None:
+            if not found:
+                index["misses"] += 1
+                return
+
+            index["hits"] += 1
+            if key in index["entries"]:
+                index["entries"][key]["last_access"] = time.time()
+
+        try:
+            index = self._memo_update_index(_record_lookup)
+            app_log.debug(
+                f"Memoization {'hit' if found else 'miss'} for {key} "
+                f"(hits: {index['hits']}, misses: {index['misses']})."
+            )
+        except Exception as e:
+            app_log.warning(f"Failed to record memoization lookup for {key}: {e}")
+
+        return found, result
+
+    def _memo_store(self, key: str, result: Any) -> None:
+        """Store a task's result in the memoization index.
+
+        Failures are logged and otherwise ignored, since the task itself succeeded.
+
+        Args:
+            key: Memoization key of the task.
+            result: The task's result, as a Python object.
+
+        Returns:
+            None
+        """
+
+        result_filename = f"memo-{key}.pkl"
+
+        def _record_result(index: Dict) -> None:
+            # Pushed under the lock so that a concurrent eviction cannot remove it
+            self._memo_push(local_filename, result_filename)
+
+            now = time.time()
+            index["entries"][key] = {
+                "result_filename": result_filename,
+                "created": now,
+                "last_access": now,
+            }
+
+        fd, local_filename = tempfile.mkstemp(dir=self.cache_dir)
+
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(result, f)
+
+            self._memo_update_index(_record_result)
+            app_log.debug(f"Memoized result for {key}.")
+        except Exception as e:
+            app_log.warning(f"Failed to memoize result for {key}: {e}")
+        finally:
+            if os.path.exists(local_filename):
+                os.remove(local_filename)
@@ -0,0 +1,377 @@
+# Copyright 2021 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the Kubernetes executor memoization."""
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+from functools import partial
+from unittest import mock
+
+import pytest
+from botocore.exceptions import ClientError
+from covalent._workflow.transport import TransportableObject
+from covalent.executor.utils.wrappers import wrapper_fn
+
+from covalent_kubernetes_plugin import k8s
+from covalent_kubernetes_plugin.k8s import _EXECUTOR_PLUGIN_DEFAULTS, KubernetesExecutor
+
+
+def _add(x, y):
+    return x + y
+
+
+@pytest.fixture
+def executor_factory(tmp_path):
+    """Create executors whose configuration comes from the plugin defaults."""
+
+    config = {f"executors.k8s.{key}": value for key, value in _EXECUTOR_PLUGIN_DEFAULTS.items()}
+    config["executors.k8s.data_store"] = str(tmp_path)
+    config["executors.k8s.cache_dir"] = str(tmp_path)
+
+    def _factory(**kwargs):
+        with mock.patch.object(k8s, "get_config", side_effect=config.__getitem__):
+            return KubernetesExecutor(**kwargs)
+
+    return _factory, config
+
+
+@pytest.fixture
+def s3_client():
+    """Mock the S3 client with an in-memory bucket."""
+
+    bucket = {}
+
+    def _download_file(bucket_name, key, filename):
+        if key not in bucket:
+            raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+        with open(filename, "wb") as f:
+            f.write(bucket[key])
+
+    def _upload_file(filename, bucket_name, key):
+        with open(filename, "rb") as f:
+            bucket[key] = f.read()
+
+    s3 = mock.MagicMock()
+    s3.download_file.side_effect = _download_file
+    s3.upload_file.side_effect = _upload_file
+    s3.delete_object.side_effect = lambda Bucket, Key: bucket.pop(Key)
+
+    with mock.patch("boto3.client", return_value=s3):
+        yield s3, bucket
+
+
+def _read_index(executor):
+    with open(os.path.join(executor.cache_dir, k8s._MEMO_INDEX_FILENAME)) as f:
+        return json.load(f)
+
+
+def test_memoize_options_override_config(executor_factory):
+    """Explicit falsy options take precedence over the configuration."""
+
+    factory, config = executor_factory
+    config["executors.k8s.memoize"] = True
+    config["executors.k8s.memoize_ttl"] = 60
+    config["executors.k8s.memoize_max_entries"] = 10
+
+    executor = factory()
+    assert executor.memoize is True
+    assert executor.memoize_ttl == 60
+    assert executor.memoize_max_entries == 10
+
+    executor = factory(memoize=False, memoize_ttl=0, memoize_max_entries=0)
+    assert executor.memoize is False
+    assert executor.memoize_ttl == 0
+    assert executor.memoize_max_entries == 0
+
+
+def test_memo_key_covers_task_and_environment(executor_factory):
+    """The key changes with the arguments and with the base image."""
+
+    factory, _ = executor_factory
+    executor = factory()
+    other_image = factory(base_image="python:3.10-slim")
+
+    key = executor._memo_key(_add, [1, 2], {})
+    assert key == executor._memo_key(_add, [1, 2], {})
+    assert key != executor._memo_key(_add, [1, 3], {})
+    assert key != other_image._memo_key(_add, [1, 2], {})
+
+
+def test_memo_key_stable_across_processes(executor_factory, tmp_path):
+    """Tasks wrapped by the dispatcher hash identically in separate processes."""
+
+    script = textwrap.dedent(
+        f"""
+        from functools import partial
+        from unittest import mock
+
+        from covalent._workflow.transport import TransportableObject
+        from covalent.executor.utils.wrappers import wrapper_fn
+
+        from covalent_kubernetes_plugin import k8s
+
+        def add(x, y):
+            return x + y
+
+        config = {{f"executors.k8s.{{k}}": v for k, v in k8s._EXECUTOR_PLUGIN_DEFAULTS.items()}}
+        config["executors.k8s.cache_dir"] = {str(tmp_path)!r}
+
+        with mock.patch.object(k8s, "get_config", side_effect=config.__getitem__):
+            executor = k8s.KubernetesExecutor()
+
+        function = partial(wrapper_fn, TransportableObject(add), [], [])
+        args = [TransportableObject(1), TransportableObject(2)]
+        kwargs = {{"z": TransportableObject({{"a": [1, 2]}})}}
+        print(executor._memo_key(function, args, kwargs))
+        """
+    )
+
+    keys = {
+        subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            check=True,
+            text=True,
+            env={**os.environ, "PYTHONHASHSEED": str(seed)},
+        ).stdout.strip()
+        for seed in range(3)
+    }
+
+    assert len(keys) == 1
+
+
+def test_memo_key_ignores_object_string(executor_factory):
+    """The string representation of a TransportableObject does not affect the key."""
+
+    factory, _ = executor_factory
+    executor = factory()
+
+    def _build(object_string):
+        function = TransportableObject(_add)
+        function._object_string = object_string
+        return partial(wrapper_fn, function, [], []), [TransportableObject(1)], {}
+
+    assert executor._memo_key(*_build("<function at 0x1>")) == executor._memo_key(
+        *_build("<function at 0x2>")
+    )
+
+
+def test_memo_store_and_lookup(executor_factory):
+    """A stored result is returned and the counters are persisted in the index."""
+
+    factory, _ = executor_factory
+    executor = factory(memoize=True)
+
+    assert executor._memo_lookup("key") == (False, None)
+
+    executor._memo_store("key", {"answer": 42})
+    assert executor._memo_lookup("key") == (True, {"answer": 42})
+
+    index = _read_index(executor)
+    assert index["hits"] == 1
+    assert index["misses"] == 1
+    assert list(index["entries"]) == ["key"]
+
+
+def test_memo_lookup_expired_entry(executor_factory):
+    """Entries older than the TTL are treated as misses and evicted."""
+
+    factory, _ = executor_factory
+    executor = factory(memoize=True, memoize_ttl=10)
+
+    with mock.patch.object(k8s.time, "time", return_value=1000.0):
+        executor._memo_store("key", 1)
+
+    with mock.patch.object(k8s.time, "time", return_value=1011.0):
+        assert executor._memo_lookup("key") == (False, None)
+        executor._memo_store("other", 2)
+
+    assert list(_read_index(executor)["entries"]) == ["other"]
+    assert not os.path.exists(os.path.join(executor.cache_dir, "memo-key.pkl"))
+
+
+def test_memo_lookup_counts_misses(executor_factory):
+    """Misses are counted even when no result is stored afterwards."""
+
+    factory, _ = executor_factory
+    executor = factory(memoize=True)
+
+    assert executor._memo_lookup("key") == (False, None)
+    assert executor._memo_lookup("key") == (False, None)
+
+    index = _read_index(executor)
+    assert index["misses"] == 2
+    assert index["entries"] == {}
+
+
+def test_memo_store_replaces_expired_entry(executor_factory):
+    """Storing a result for an expired key keeps the new result file."""
+
+    factory, _ = executor_factory
+    executor = factory(memoize=True, memoize_ttl=10)
+
+    with mock.patch.object(k8s.time, "time", return_value=1000.0):
+        executor._memo_store("key", 1)
+
+    with mock.patch.object(k8s.time, "time", return_value=1011.0):
+        executor._memo_store("key", 2)
+        assert executor._memo_lookup("key") == (True, 2)
+
+
+def test_memo_evict_least_recently_used(executor_factory):
+    """Eviction keeps the most recently accessed entries."""
+
+    factory, _ = executor_factory
+    executor = factory(memoize=True, memoize_max_entries=2)
+    index = {
+        "hits": 0,
+        "misses": 0,
+        "entries": {
+            key: {"result_filename": f"memo-{key}.pkl", "created": 0, "last_access": access}
+            for key, access in [("a", 3), ("b", 1), ("c", 2)]
+        },
+    }
+
+    assert executor._memo_evict(index) == ["memo-b.pkl"]
+    assert sorted(index["entries"]) == ["a", "c"]
+
+
+def test_memo_corrupt_index_is_ignored(executor_factory):
+    """An unreadable index results in a miss and is rewritten on store."""
+
+    factory, _ = executor_factory
+    executor = factory(memoize=True)
+
+    with open(os.path.join(executor.cache_dir, k8s._MEMO_INDEX_FILENAME), "w") as f:
+        f.write('{"entries": ')
+
+    assert executor._memo_lookup("key") == (False, None)
+
+    executor._memo_store("key", 1)
+    assert executor._memo_lookup("key") == (True, 1)
+
+
+def test_memo_store_failure_is_ignored(executor_factory):
+    """A failure while memoizing does not propagate to the task."""
+
+    factory, _ = executor_factory
+    executor = factory(memoize=True)
+
+    with mock.patch.object(executor, "_memo_update_index", side_effect=OSError("denied")):
+        executor._memo_store("key", 1)
+
+
+def test_run_memo_hit_skips_cluster(executor_factory):
+    """A memoized task is returned without touching the Kubernetes configuration."""
+
+    factory, _ = executor_factory
+    executor = factory(memoize=True)
+    executor._memo_store(executor._memo_key(_add, [1, 2], {}), 3)
+
+    with mock.patch.object(k8s, "config") as mock_config, mock.patch.object(
+        executor, "_package_and_upload"
+    ) as mock_package:
+        result = executor.run(_add, [1, 2], {}, {"dispatch_id": "abc", "node_id": 0})
+
+    assert result == 3
+    mock_config.load_kube_config.assert_not_called()
+    mock_package.assert_not_called()
+
+
+def test_run_memo_miss_stores_result(executor_factory):
+    """A task missing from the index is executed on the cluster and then memoized."""
+
+    factory, _ = executor_factory
+    executor = factory(memoize=True, k8s_context="minikube")
+
+    with mock.patch.object(k8s, "config") as mock_config, mock.patch.object(
+        k8s, "client"
+    ), mock.patch.object(
+        executor, "_package_and_upload", return_value="covalent-eks-task:abc-0"
+    ), mock.patch.object(
+        executor, "_poll_task"
+    ), mock.patch.object(
+        executor, "_query_result", return_value=3
+    ):
+        mock_config.list_kube_config_contexts.return_value = ([{"name": "minikube"}], None)
+        result = executor.run(_add, [1, 2], {}, {"dispatch_id": "abc", "node_id": 0})
+
+    assert result == 3
+    assert executor._memo_lookup(executor._memo_key(_add, [1, 2], {})) == (True, 3)
+
+
+def test_memo_fetch_s3(executor_factory, s3_client):
+    """Files in S3 are downloaded to unique paths, and missing files are misses."""
+
+    factory, _ = executor_factory
+    executor = factory(data_store="s3://bucket/path/")
+    s3, bucket = s3_client
+    bucket["memo-key.pkl"] = b"data"
+
+    first = executor._memo_fetch("memo-key.pkl")
+    second = executor._memo_fetch("memo-key.pkl")
+    assert first != second
+    assert os.path.dirname(first) == executor.cache_dir
+    s3.download_file.assert_called_with("bucket", "memo-key.pkl", second)
+
+    executor._memo_release(first)
+    executor._memo_release(second)
+    assert not os.path.exists(first)
+    assert not os.path.exists(second)
+
+    assert executor._memo_fetch("memo-other.pkl") is None
+    assert os.listdir(executor.cache_dir) == []
+
+
+def test_memo_push_and_delete_s3(executor_factory, s3_client):
+    """Files are uploaded to and deleted from the S3 bucket."""
+
+    factory, _ = executor_factory
+    executor = factory(data_store="s3://bucket/path/")
+    s3, bucket = s3_client
+
+    local_filename = os.path.join(executor.cache_dir, "upload")
+    with open(local_filename, "wb") as f:
+        f.write(b"data")
+
+    executor._memo_push(local_filename, "memo-key.pkl")
+    s3.upload_file.assert_called_once_with(local_filename, "bucket", "memo-key.pkl")
+    assert bucket == {"memo-key.pkl": b"data"}
+    assert not os.path.exists(local_filename)
+
+    executor._memo_delete("memo-key.pkl")
+    s3.delete_object.assert_called_once_with(Bucket="bucket", Key="memo-key.pkl")
+    assert bucket == {}
+
+
+def test_memo_store_and_lookup_s3(executor_factory, s3_client):
+    """Results round-trip through S3 without leaving files in the cache directory."""
+
+    factory, _ = executor_factory
+    executor = factory(data_store="s3://bucket/path/", memoize=True, memoize_max_entries=1)
+    _, bucket = s3_client
+
+    executor._memo_store("a", 1)
+    executor._memo_store("b", 2)
+
+    assert executor._memo_lookup("a") == (False, None)
+    assert executor._memo_lookup("b") == (True, 2)
+    assert set(bucket) == {k8s._MEMO_INDEX_FILENAME, "memo-b.pkl"}
+    assert os.listdir(executor.cache_dir) == [f"{k8s._MEMO_INDEX_FILENAME}.lock"]